@@ -5,9 +5,12 @@ from .beautify import (
     bprint,
     beautify_output,
     BeautifyContext,
+    BeautifyBuffer,
+    AsyncBeautifyBuffer,
     enable_beautiful_print,
     disable_beautiful_print,
     beautifier,
+    configure_console,
     BPrint
 )
 
@@ -16,9 +19,12 @@ __all__ = [
     'bprint',
     'beautify_output',
     'BeautifyContext',
+    'BeautifyBuffer',
+    'AsyncBeautifyBuffer',
     'enable_beautiful_print',
     'disable_beautiful_print',
     'beautifier',
+    'configure_console',
     'BPrint'
 ]
 
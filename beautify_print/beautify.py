@@ -4,22 +4,78 @@ A module for beautifying console output using Rich library.
 Provides a unified bprint function with multiple output modes.
 """
 
-from functools import wraps
-from typing import Any, Optional, Callable, Literal, Union
-from rich.console import Console
+from functools import lru_cache, partial, wraps
+from typing import TYPE_CHECKING, Any, Optional, Callable, Literal, Union
+from rich.console import Console, Group
 from rich.pretty import Pretty
-from rich.markdown import Markdown
-from rich.panel import Panel
 from rich.text import Text
-from rich.table import Table
-from rich.syntax import Syntax
+import atexit
 import builtins
 import inspect
+import os
+import queue
+import threading
+
+if TYPE_CHECKING:
+    # Imported lazily at runtime to keep package import cheap
+    from rich.markdown import Markdown
+    from rich.table import Table
+
+
+# Texts longer than this are not cached, so the cache stays small.
+_MAX_CACHED_TEXT = 4096
+
+
+# Markdown parses its source when constructed and the result can be rendered
+# again, so repeated prints of the same text skip re-parsing. Eviction is LRU only.
+@lru_cache(maxsize=256)
+def _cached_markdown(text: str) -> "Markdown":
+    from rich.markdown import Markdown
+    return Markdown(text)
+
+
+def _make_markdown(text: str) -> "Markdown":
+    if len(text) > _MAX_CACHED_TEXT:
+        from rich.markdown import Markdown
+        return Markdown(text)
+    return _cached_markdown(text)
+
+
+@lru_cache(maxsize=512)
+def _format_title(title: str, width: int, style: str, align: str) -> str:
+    """Build the markup for a title line with separators."""
+    if align == "center":
+        # Centered title with separators
+        separator_len = (width - len(title) - 2) // 2
+        left_sep = "-" * separator_len
+        right_sep = "-" * (width - len(title) - 2 - separator_len)
+        return f"[{style}]{left_sep} {title} {right_sep}[/{style}]"
+    elif align == "left":
+        # Left-aligned title
+        separator = "-" * (width - len(title) - 1)
+        return f"[{style}]{title} {separator}[/{style}]"
+    else:  # right
+        # Right-aligned title
+        separator = "-" * (width - len(title) - 1)
+        return f"[{style}]{separator} {title}[/{style}]"
+
+
+@lru_cache(maxsize=512)
+def _title_text(title: str, width: int, style: str, align: str) -> Text:
+    """Parse a title's markup once; the Text is only read when rendered."""
+    return Text.from_markup(_format_title(title, width, style, align))
+
+
+def _use_plain_output(console: Console) -> bool:
+    """Whether to bypass Rich because output is not a terminal (FORCE_RICH=1 overrides)."""
+    return not (console.is_terminal or console.is_jupyter or os.environ.get("FORCE_RICH"))
 
 
 class BeautifyPrinter:
     """A customizable pretty printer using Rich library."""
     
+    __slots__ = ("_console", "_plain", "_original_print", "_defaults", "_buffer_depth")
+    
     def __init__(self, console: Optional[Console] = None):
         """
         Initialize BeautifyPrinter with a Rich console.
@@ -29,6 +85,19 @@ class BeautifyPrinter:
         """
         self.console = console or Console()
         self._original_print = builtins.print
+        self._defaults = {}
+        self._buffer_depth = 0
+    
+    @property
+    def console(self) -> Console:
+        """The Rich console this printer writes to."""
+        return self._console
+    
+    @console.setter
+    def console(self, console: Console):
+        self._console = console
+        # Decide once per console; is_terminal costs an isatty() call
+        self._plain = _use_plain_output(console)
     
     def print(
         self,
@@ -95,7 +164,25 @@ class BeautifyPrinter:
             - line_numbers: Whether to show line numbers
             
             **kwargs: Additional Rich console.print kwargs
+        
+        When output is not a terminal (and FORCE_RICH is unset), calls without a display
+        mode or Rich kwargs are written with the built-in print; only sep and end apply.
         """
+        # Plain output when redirected: styling would be invisible anyway.
+        # Calls with Rich options stay on the Rich path.
+        if (
+            self._plain
+            and not (markdown or code or table or panel or title)
+            and kwargs.keys() <= {"end"}
+        ):
+            end = kwargs.get("end", "\n")
+            if self._buffer_depth:
+                # Same text, but into the active capture so ordering is kept
+                self.console.out(*args, sep=sep, end=end, highlight=False)
+            else:
+                self._original_print(*args, sep=sep, end=end, file=self.console.file)
+            return
+        
         # Handle empty args
         if not args:
             self.console.print(**kwargs)
@@ -103,7 +190,10 @@ class BeautifyPrinter:
         
         # Prepare the content
         if len(args) > 1:
-            content = sep.join(str(arg) for arg in args)
+            if all(type(arg) is str for arg in args):
+                content = sep.join(args)
+            else:
+                content = sep.join(map(str, args))
         else:
             content = args[0]
         
@@ -112,12 +202,13 @@ class BeautifyPrinter:
             # Markdown mode
             if not isinstance(content, str):
                 content = str(content)
-            output = Markdown(content)
+            output = _make_markdown(content)
         
         elif code:
             # Code/syntax highlighting mode
             if not isinstance(content, str):
                 content = str(content)
+            from rich.syntax import Syntax  # lazy: pulls in Pygments
             output = Syntax(
                 content,
                 language,
@@ -131,6 +222,18 @@ class BeautifyPrinter:
         
         else:
             # Pretty print mode (default)
+            if not (title or panel) and (content is None or type(content) in (str, int, float, bool)):
+                # Plain scalars skip the Pretty repr machinery; strings print
+                # unquoted, without markup or emoji codes unless asked for.
+                # Numbers, bools and None stay highlighted like Pretty output.
+                text = self.console.render_str(
+                    str(content),
+                    markup=kwargs.pop("markup", False),
+                    emoji=kwargs.pop("emoji", False),
+                    highlight=kwargs.pop("highlight", type(content) is not str),
+                )
+                self.console.print(text, **kwargs)
+                return
             output = Pretty(
                 content,
                 expand_all=expand_all,
@@ -143,6 +246,7 @@ class BeautifyPrinter:
         
         # Apply panel if specified
         elif panel:
+            from rich.panel import Panel
             panel_kwargs = {
                 "title": title if title else None,
                 "style": panel_style,
@@ -164,42 +268,36 @@ class BeautifyPrinter:
         **kwargs
     ):
         """Internal method to print with formatted title."""
-        if align == "center":
-            # Centered title with separators
-            separator_len = (width - len(title) - 2) // 2
-            left_sep = "-" * separator_len
-            right_sep = "-" * (width - len(title) - 2 - separator_len)
-            formatted_title = f"[{style}]{left_sep} {title} {right_sep}[/{style}]"
-        elif align == "left":
-            # Left-aligned title
-            separator = "-" * (width - len(title) - 1)
-            formatted_title = f"[{style}]{title} {separator}[/{style}]"
-        else:  # right
-            # Right-aligned title
-            separator = "-" * (width - len(title) - 1)
-            formatted_title = f"[{style}]{separator} {title}[/{style}]"
-        
-        self.console.print(formatted_title)
-        self.console.print(obj, **kwargs)
-    
-    def _create_table(self, data: Union[dict, list]) -> Table:
+        title_text = _title_text(title, width, style, align)
+        if kwargs:
+            # Per-call options (justify, style, ...) apply to the body only
+            self.console.print(title_text)
+            self.console.print(obj, **kwargs)
+        else:
+            # Render title and body in one pass instead of two console writes
+            self.console.print(Group(title_text, obj))
+    
+    def _create_table(self, data: Union[dict, list]) -> "Table":
         """Create a Rich table from data."""
+        from rich.table import Table
         table = Table(show_header=True, header_style="bold magenta")
         
         if isinstance(data, dict):
             # Dictionary: keys as columns, values as single row
             for key in data.keys():
                 table.add_column(str(key))
-            table.add_row(*[str(v) for v in data.values()])
+            table.add_row(*map(str, data.values()))
         
         elif isinstance(data, list) and data:
+            add_row = table.add_row
             if isinstance(data[0], dict):
                 # List of dictionaries
-                keys = data[0].keys()
+                keys = tuple(data[0].keys())
                 for key in keys:
                     table.add_column(str(key))
                 for item in data:
-                    table.add_row(*[str(item.get(k, "")) for k in keys])
+                    get = item.get
+                    add_row(*[str(get(k, "")) for k in keys])
             
             elif isinstance(data[0], (list, tuple)):
                 # List of lists/tuples - first item as headers
@@ -207,27 +305,77 @@ class BeautifyPrinter:
                 for header in headers:
                     table.add_column(str(header))
                 for row in data[1:]:
-                    table.add_row(*[str(item) for item in row])
+                    add_row(*map(str, row))
             
             else:
                 # Simple list - single column
                 table.add_column("Value")
                 for item in data:
-                    table.add_row(str(item))
+                    add_row(str(item))
         
         return table
     
     def monkey_patch_print(self):
         """Replace built-in print with beautified version."""
-        builtins.print = lambda *args, **kwargs: self.print(*args, **kwargs)
+        builtins.print = self.print
+    
+    def _print_with_defaults(self, *args, **kwargs):
+        """Print with the defaults set by enable_beautiful_print."""
+        self.print(*args, **({**self._defaults, **kwargs} if kwargs else self._defaults))
     
     def restore_print(self):
         """Restore original built-in print function."""
         builtins.print = self._original_print
+    
+    def flush_capture(self, console: Optional[Console] = None):
+        """
+        End a capture started with console.begin_capture() and write it in a single write.
+        
+        Capturing on the real console keeps every console setting (width, highlighting,
+        emoji, color system) applied to the buffered output.
+        
+        Args:
+            console: Console the capture was started on. Uses this printer's console if None.
+        """
+        console = console or self.console
+        rendered = console.end_capture()
+        if rendered:
+            console.file.write(rendered)
+            console.file.flush()
+    
+    def buffered(self, flush_every: int = 0) -> "BeautifyBuffer":
+        """
+        Return a buffering context bound to this printer's console.
+        
+        Args:
+            flush_every: Auto-flush once this many renderables are buffered (0 = only on exit)
+        """
+        return BeautifyBuffer(self, flush_every=flush_every)
+
 
+# Settings for the shared console. Auto-highlighting is off: Pretty output has
+# its own highlighter, and Rich's regex highlighter is costly on plain strings.
+_CONSOLE_DEFAULTS = {
+    "color_system": "auto",
+    "force_terminal": None,
+    "width": None,
+    "highlight": False,
+    "log_time": False,
+    "log_path": False,
+}
 
 # Create a global instance
-beautifier = BeautifyPrinter()
+beautifier = BeautifyPrinter(Console(**_CONSOLE_DEFAULTS))
+
+
+def configure_console(**console_kwargs):
+    """
+    Replace the console used by the global beautifier.
+    
+    Args:
+        **console_kwargs: Rich Console arguments, overriding the package defaults
+    """
+    beautifier.console = Console(**{**_CONSOLE_DEFAULTS, **console_kwargs})
 
 
 # Main unified function
@@ -310,6 +458,8 @@ def beautify_output(
 class BeautifyContext:
     """Context manager for temporarily replacing print with beautified version."""
     
+    __slots__ = ("default_kwargs", "_original_print")
+    
     def __init__(self, **default_kwargs):
         """
         Initialize context with default arguments for all prints.
@@ -322,16 +472,162 @@ class BeautifyContext:
     def __enter__(self):
         self._original_print = builtins.print
         # Create a custom print that includes default kwargs
-        builtins.print = lambda *args, **kwargs: bprint(
-            *args, 
-            **{**self.default_kwargs, **kwargs}
-        )
+        defaults = self.default_kwargs
+        
+        def _patched(*args, **kwargs):
+            if not kwargs:
+                bprint(*args, **defaults)
+            else:
+                bprint(*args, **{**defaults, **kwargs})
+        
+        builtins.print = _patched
         return beautifier
     
     def __exit__(self, exc_type, exc_val, exc_tb):
         builtins.print = self._original_print
 
 
+# Context manager for coalescing many prints into one write
+class BeautifyBuffer:
+    """
+    Context manager that collects rendered output and flushes it in one print.
+    
+    Examples:
+        with BeautifyBuffer():
+            for x in items:
+                bprint(x)
+    """
+    
+    __slots__ = ("printer", "flush_every", "_count", "_console", "_original_print", "_outer_print")
+    
+    def __init__(self, printer: Optional[BeautifyPrinter] = None, flush_every: int = 0):
+        """
+        Initialize buffer for a printer.
+        
+        Args:
+            printer: BeautifyPrinter whose console is buffered. Uses the global beautifier if None.
+            flush_every: Auto-flush after this many prints (0 = only on exit)
+        """
+        self.printer = printer or beautifier
+        self.flush_every = flush_every
+        self._count = 0
+    
+    def __enter__(self):
+        # Keep the console itself: configure_console() may swap the printer's console
+        console = self._console = self.printer.console
+        self._original_print = console.print
+        # Only an enclosing buffer leaves an instance-level print to restore
+        self._outer_print = vars(console).get("print")
+        console.print = self._buffer_print
+        console.begin_capture()
+        self.printer._buffer_depth += 1
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        console = self._console
+        try:
+            self.printer.flush_capture(console)
+        finally:
+            if self._outer_print is None:
+                del console.print
+            else:
+                console.print = self._outer_print
+            self.printer._buffer_depth -= 1
+    
+    def _buffer_print(self, *objects, **kwargs):
+        """Render immediately into the capture so objects print in their current state."""
+        self._original_print(*objects, **kwargs)
+        self._count += 1
+        if self.flush_every and self._count >= self.flush_every:
+            self.flush()
+    
+    def flush(self):
+        """Write everything captured so far in a single write."""
+        self._count = 0
+        self.printer.flush_capture(self._console)
+        self._console.begin_capture()
+
+
+# Context manager for printing from a background thread
+class AsyncBeautifyBuffer:
+    """
+    Context manager that renders and writes prints on a background thread.
+    
+    Output written directly to stdout/stderr elsewhere is not ordered with
+    queued prints; call flush() at points where ordering matters. Arguments are
+    rendered when the drain thread reaches them, so mutable objects changed after
+    abprint() show their later state; pass a copy if that matters. After close(),
+    abprint() prints synchronously. The drain thread starts on construction; if
+    the buffer is never closed, close() runs at interpreter exit so queued prints
+    are still written.
+    
+    Examples:
+        with AsyncBeautifyBuffer() as out:
+            for x in items:
+                out.abprint(x, title="Item")
+    """
+    
+    __slots__ = ("printer", "_q", "_thread", "_lock", "_closed")
+    
+    def __init__(self, printer: Optional[BeautifyPrinter] = None):
+        """
+        Initialize the queue and start the drain thread.
+        
+        Args:
+            printer: BeautifyPrinter that renders queued prints. Uses the global beautifier if None.
+        """
+        self.printer = printer or beautifier
+        self._q = queue.Queue()
+        self._lock = threading.Lock()
+        self._closed = False
+        self._thread = threading.Thread(target=self._drain, daemon=True)
+        self._thread.start()
+        atexit.register(self.close)
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+    
+    def abprint(self, *args, **kwargs):
+        """Queue a bprint call; accepts the same arguments as bprint."""
+        with self._lock:
+            if not self._closed:
+                self._q.put((args, kwargs))
+                return
+        self.printer.print(*args, **kwargs)
+    
+    def flush(self):
+        """Block until every queued print has been written."""
+        self._q.join()
+    
+    def close(self):
+        """Write remaining prints and stop the drain thread."""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            self._q.put(None)
+        self._thread.join()
+        atexit.unregister(self.close)
+    
+    def _drain(self):
+        """Print queued items until the stop sentinel arrives."""
+        while True:
+            item = self._q.get()
+            try:
+                if item is None:
+                    return
+                args, kwargs = item
+                self.printer.print(*args, **kwargs)
+            except Exception:
+                # Keep draining so flush() and close() never hang
+                self.printer.console.print_exception()
+            finally:
+                self._q.task_done()
+
+
 # Convenience functions for common use cases
 def enable_beautiful_print(**default_kwargs):
     """
@@ -340,7 +636,8 @@ def enable_beautiful_print(**default_kwargs):
     Args:
         **default_kwargs: Default arguments for all beautified prints
     """
-    builtins.print = lambda *args, **kwargs: bprint(*args, **{**default_kwargs, **kwargs})
+    beautifier._defaults = default_kwargs
+    builtins.print = beautifier._print_with_defaults
 
 
 def disable_beautiful_print():
@@ -352,33 +649,42 @@ def disable_beautiful_print():
 class BPrint:
     """Namespace for preset beautify print functions."""
     
+    __slots__ = ()
+    
+    # Panel presets bound once instead of rebuilding kwargs on every call
+    _debug = staticmethod(partial(bprint, panel=True, panel_style="red"))
+    _info = staticmethod(partial(bprint, panel=True, panel_style="blue"))
+    _success = staticmethod(partial(bprint, panel=True, panel_style="green"))
+    _warning = staticmethod(partial(bprint, panel=True, panel_style="yellow"))
+    _error = staticmethod(partial(bprint, panel=True, panel_style="red bold"))
+    _json = staticmethod(partial(bprint, panel=True, expand_all=True, indent_guides=True))
+    
     @staticmethod
     def debug(obj: Any, name: str = "DEBUG"):
         """Print debug information with automatic variable name detection."""
-        bprint(obj, title=f"🐛 {name}", panel=True, panel_style="red")
+        BPrint._debug(obj, title=f"🐛 {name}")
     
     @staticmethod
     def info(obj: Any, title: str = "INFO"):
         """Print informational message."""
-        bprint(obj, title=f"ℹ️  {title}", panel=True, panel_style="blue")
+        BPrint._info(obj, title=f"ℹ️  {title}")
     
     @staticmethod
     def success(obj: Any, title: str = "SUCCESS"):
         """Print success message."""
-        bprint(obj, title=f"✅ {title}", panel=True, panel_style="green")
+        BPrint._success(obj, title=f"✅ {title}")
     
     @staticmethod
     def warning(obj: Any, title: str = "WARNING"):
         """Print warning message."""
-        bprint(obj, title=f"⚠️  {title}", panel=True, panel_style="yellow")
+        BPrint._warning(obj, title=f"⚠️  {title}")
     
     @staticmethod
     def error(obj: Any, title: str = "ERROR"):
         """Print error message."""
-        bprint(obj, title=f"❌ {title}", panel=True, panel_style="red bold")
+        BPrint._error(obj, title=f"❌ {title}")
     
     @staticmethod
     def json(obj: Any, title: str = ""):
         """Print as formatted JSON-like structure."""
-        kwargs = {"title": title} if title else {}
-        bprint(obj, panel=True, expand_all=True, indent_guides=True, **kwargs)
\ No newline at end of file
+        BPrint._json(obj, title=title)